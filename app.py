@@ -10,7 +10,7 @@ from typing import List, Generator, Dict, Any
 
 from flask import Flask, render_template, request, Response, stream_with_context, send_file, jsonify
 from utils.scraper import stream_analysis
-from utils.excel_export import create_excel_report
+from utils.excel_export import create_excel_report, create_arrow_report
 
 app = Flask(__name__)
 
@@ -141,6 +141,43 @@ def download_excel(session_id):
         app.logger.error(f"Error generating Excel file: {e}")
         return jsonify({"error": "Failed to generate Excel file"}), 500
 
+@app.route("/download/parquet/<session_id>")
+def download_parquet(session_id):
+    """Download analysis results as a Parquet file for programmatic use"""
+    if session_id not in analysis_cache:
+        return jsonify({"error": "Session not found or expired"}), 404
+    
+    results = analysis_cache[session_id]["results"]
+    
+    if not results:
+        return jsonify({"error": "No results available for download"}), 400
+    
+    try:
+        filename = f"ratemysite_analysis_{session_id[:8]}.parquet"
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        
+        create_arrow_report(results, filepath)
+        
+        # Remove the file once sent; the session stays cached for the Excel download
+        def cleanup():
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+        
+        response = send_file(
+            filepath,
+            as_attachment=True,
+            download_name=filename,
+            mimetype='application/vnd.apache.parquet'
+        )
+        response.call_on_close(cleanup)
+        return response
+        
+    except Exception as e:
+        app.logger.error(f"Error generating Parquet file: {e}")
+        return jsonify({"error": "Failed to generate Parquet file"}), 500
+
 @app.route("/api/cache/<session_id>")
 def get_cache(session_id):
     """Get cached analysis data (for debugging)"""
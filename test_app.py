@@ -80,6 +80,122 @@ def test_app_creation():
         print(f"❌ App creation error: {e}")
         return False
 
+def test_excel_export():
+    """Test that Excel reports can be generated for more than 26 sites"""
+    try:
+        import tempfile
+        from openpyxl import load_workbook
+        from app import TABLE_ROWS
+        from utils.excel_export import create_excel_report, create_detailed_excel_report
+        
+        results = [
+            {"Company": f"Site {i}", "URL": f"https://www.site{i}.com/", "Overall Score": str(40 + i)}
+            for i in range(30)
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "report.xlsx")
+            create_excel_report(results, filepath, TABLE_ROWS)
+            ws = load_workbook(filepath).active
+            # Header row is row 5; site 30 lands in column AE
+            if ws["AE5"].value != "site29.com":
+                print(f"❌ Unexpected header in column AE: {ws['AE5'].value}")
+                return False
+            print("✅ Excel report created for 30 sites")
+            
+            detailed_path = os.path.join(tmpdir, "detailed.xlsx")
+            create_detailed_excel_report(results, detailed_path)
+            sheets = load_workbook(detailed_path).sheetnames
+            if sheets != ["Summary", "Detailed Data", "Scores Comparison"]:
+                print(f"❌ Unexpected detailed report sheets: {sheets}")
+                return False
+            print("✅ Detailed Excel report created")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Excel export error: {e}")
+        return False
+
+def test_arrow_export():
+    """Test the Parquet/Feather export and its download endpoint"""
+    try:
+        import tempfile
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+        from app import app, analysis_cache
+        from utils.excel_export import create_arrow_report
+        
+        results = [
+            {"Company": "Site A", "URL": "https://a.com", "Overall Score": "85", "_raw": "raw text"},
+            {"URL": "https://b.com", "Overall Score": "-", "Trust Score": "70", "_raw": "raw text"},
+        ]
+        expected_columns = ["Company", "URL", "Overall Score", "Trust Score"]
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tables = {}
+            for name in ("report.parquet", "report.feather"):
+                filepath = os.path.join(tmpdir, name)
+                create_arrow_report(results, filepath)
+                if name.endswith(".feather"):
+                    tables[name] = feather.read_table(filepath)
+                else:
+                    tables[name] = pq.read_table(filepath)
+            
+            for name, table in tables.items():
+                if table.column_names != expected_columns:
+                    print(f"❌ Unexpected columns in {name}: {table.column_names}")
+                    return False
+                if table.schema.field("Overall Score").type != pa.int64():
+                    print(f"❌ Overall Score in {name} is not int64")
+                    return False
+                if table.column("Overall Score").to_pylist() != [85, None]:
+                    print(f"❌ Unexpected scores in {name}: {table.column('Overall Score').to_pylist()}")
+                    return False
+                print(f"✅ {name} written with expected columns and scores")
+        
+        session_id = "test-arrow-session"
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], f"ratemysite_analysis_{session_id[:8]}.parquet")
+        try:
+            with app.test_client() as client:
+                response = client.get(f"/download/parquet/{session_id}")
+                if response.status_code != 404:
+                    print(f"❌ Unknown session returned status {response.status_code}")
+                    return False
+                
+                analysis_cache[session_id] = {"urls": [], "results": []}
+                response = client.get(f"/download/parquet/{session_id}")
+                if response.status_code != 400:
+                    print(f"❌ Empty session returned status {response.status_code}")
+                    return False
+                
+                analysis_cache[session_id]["results"] = results
+                response = client.get(f"/download/parquet/{session_id}")
+                if response.status_code != 200:
+                    print(f"❌ Parquet download returned status {response.status_code}")
+                    return False
+                # Read back from a file: pyarrow 14 can abort at exit after
+                # reading Parquet from an in-memory buffer
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    download_path = os.path.join(tmpdir, "download.parquet")
+                    with open(download_path, "wb") as f:
+                        f.write(response.get_data())
+                    response.close()
+                    table = pq.read_table(download_path)
+                if table.column_names != expected_columns:
+                    print(f"❌ Unexpected columns in downloaded Parquet: {table.column_names}")
+                    return False
+            print("✅ Parquet download endpoint working")
+        finally:
+            analysis_cache.pop(session_id, None)
+            if os.path.exists(filepath):
+                os.remove(filepath)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Arrow export error: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("🧪 Running application tests...\n")
@@ -87,7 +203,9 @@ def main():
     tests = [
         ("File Structure", test_file_structure),
         ("Module Imports", test_imports),
-        ("App Creation", test_app_creation)
+        ("App Creation", test_app_creation),
+        ("Excel Export", test_excel_export),
+        ("Arrow Export", test_arrow_export)
     ]
     
     passed = 0
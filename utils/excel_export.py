@@ -1,14 +1,198 @@
 #!/usr/bin/env python3
 """
-Excel export functionality for RateMySite analysis
+Excel and Arrow (Parquet/Feather) export functionality for RateMySite analysis
 """
 
-import pandas as pd
+import logging
+import re
+import numpy as np
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+from openpyxl.xml import LXML
+
+logger = logging.getLogger(__name__)
+
+# openpyxl serialises through lxml when it is installed (and OPENPYXL_LXML is
+# not disabled), which makes wb.save() considerably faster
+if not LXML:
+    logger.warning("lxml is not available to openpyxl; install lxml for faster XLSX saves")
+
+# Shared fonts, borders and alignments (8-char ARGB so colours are fully opaque)
+_TITLE_FONT = Font(bold=True, size=16)
+_SECTION_FONT = Font(bold=True, size=14)
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF", size=12)
+_SUBHEADER_FONT = Font(bold=True, size=11)
+_BOLD_FONT = Font(bold=True)
+_URL_FONT = Font(color="FF0000FF", underline="single")
+
+_THIN_BORDER = Border(
+    left=Side(border_style="thin"),
+    right=Side(border_style="thin"),
+    top=Side(border_style="thin"),
+    bottom=Side(border_style="thin")
+)
+
+_CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+_LEFT_ALIGNMENT = Alignment(horizontal="left", vertical="center")
+_DETAIL_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="top")
+
+# Shared fills
+_HEADER_FILL = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+_SUBHEADER_FILL = PatternFill(start_color="FFD9E2F3", end_color="FFD9E2F3", fill_type="solid")
+
+# Score fills
+_FILL_GREEN = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")  # Light green
+_FILL_YELLOW = PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid")  # Light yellow
+_FILL_RED = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")  # Light red
+
+# Score fill for each bucket: 0 (>= 80), 1 (>= 60), 2 (< 60)
+_FILLS = (_FILL_GREEN, _FILL_YELLOW, _FILL_RED)
+
+# Named style for each score bucket, indexed by bucket + 1 (bucket -1 = no score)
+_SCORE_STYLES = ("data_center", "score_green", "score_yellow", "score_red")
+
+# Domain part of a URL, without a leading "www."
+_DOMAIN_RE = re.compile(r'^https?://(?:www\.)?([^/]+)')
+
+def _styled_cell(ws, value, style=None, font=None, fill=None, border=None, alignment=None) -> Cell:
+    """Build a write-only cell with a named style and/or individual styles applied"""
+    cell = WriteOnlyCell(ws, value=value)
+    if style is not None:
+        cell.style = style
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+def _register_styles(wb: Workbook) -> None:
+    """Register the report's cell styles on wb so cells can use them by name"""
+    for style in (
+        NamedStyle(name="hdr", font=_HEADER_FONT, fill=_HEADER_FILL, border=_THIN_BORDER,
+                   alignment=_CENTER_ALIGNMENT),
+        NamedStyle(name="subheader", font=_SUBHEADER_FONT, fill=_SUBHEADER_FILL, border=_THIN_BORDER,
+                   alignment=_LEFT_ALIGNMENT),
+        NamedStyle(name="url_link", font=_URL_FONT, border=_THIN_BORDER, alignment=_CENTER_ALIGNMENT),
+        NamedStyle(name="data_center", font=DEFAULT_FONT, border=_THIN_BORDER, alignment=_CENTER_ALIGNMENT),
+    ):
+        wb.add_named_style(style)
+    
+    # One score style per bucket, named to match _SCORE_STYLES
+    for name, fill in zip(_SCORE_STYLES[1:], _FILLS):
+        wb.add_named_style(NamedStyle(name=name, font=_BOLD_FONT, fill=fill, border=_THIN_BORDER,
+                                      alignment=_CENTER_ALIGNMENT))
+
+def _track_width(col_widths: Dict[int, int], col_idx: int, value: Any) -> None:
+    """Widen a column to fit value, clamped to 10-50 characters"""
+    col_widths[col_idx] = max(col_widths.get(col_idx, 10), min(len(str(value)) + 2, 50))
+
+def _to_int(value: Any) -> Optional[int]:
+    """Convert a score value to int, returning None if it is missing or not numeric"""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _classify_scores(scores: np.ndarray) -> np.ndarray:
+    """
+    Map a score array to fill buckets: 0 green (>= 80), 1 yellow (>= 60),
+    2 red, -1 for missing (NaN) scores
+    """
+    # Branchless: each threshold the score falls below moves it one bucket down
+    buckets = (scores < 80).astype(np.int8) + (scores < 60)
+    buckets[np.isnan(scores)] = -1
+    return buckets
+
+def _prepare(results: List[Dict[str, Any]], table_rows: List[Tuple[str, str]]
+             ) -> Tuple[List[Any], Dict[str, List[str]], Dict[str, np.ndarray], List[str], np.ndarray]:
+    """
+    Parse results once into per-row lists ready for rendering
+    
+    Returns:
+        domains: Header label for each site
+        value_grid: Display string for each site, keyed by row key
+        bucket_grid: Score bucket for each site (see _classify_scores),
+            keyed by score row key
+        score_fields: Score row keys, in the column order of scores
+        scores: (sites x score_fields) float array, NaN where not numeric
+    """
+    domains = []
+    for result in results:
+        url = result.get('URL', 'Unknown')
+        match = _DOMAIN_RE.match(url) if isinstance(url, str) else None
+        domains.append(match.group(1) if match else url)
+    
+    value_grid = {}
+    for row_key, _ in table_rows:
+        values = []
+        for result in results:
+            value = result.get(row_key, '-')
+            values.append('-' if value is None else str(value))
+        value_grid[row_key] = values
+    
+    # Missing scores are None, which NumPy stores as NaN
+    score_fields = [key for key, _ in table_rows if 'Score' in key]
+    scores = np.array(
+        [[_to_int(result.get(key)) for key in score_fields] for result in results],
+        dtype=float,
+    )
+    buckets = _classify_scores(scores)
+    bucket_grid = {key: buckets[:, idx] for idx, key in enumerate(score_fields)}
+    
+    return domains, value_grid, bucket_grid, score_fields, scores
+
+def _build_data_rows(ws, table_rows: List[Tuple[str, str]], value_grid: Dict[str, List[str]],
+                     bucket_grid: Dict[str, np.ndarray], col_widths: Dict[int, int]) -> List[list]:
+    """
+    Build the category rows of the report table, one styled cell per site
+    
+    Style selection is a lookup on the precomputed score buckets, so no
+    values are parsed here. Column widths are tracked in col_widths.
+    """
+    rows = []
+    for row_key, row_display in table_rows:
+        # Category name in column A
+        row_cells = [_styled_cell(ws, row_display, style="subheader")]
+        _track_width(col_widths, 1, row_display)
+        
+        is_score_row = 'Score' in row_key
+        is_url_row = row_key == 'URL'
+        buckets = bucket_grid[row_key] if is_score_row else None
+        
+        # Data for each site
+        for col_idx, value in enumerate(value_grid[row_key], start=2):
+            # Missing values are left as empty cells: no styling, no XML element
+            if value in ('', '-'):
+                row_cells.append(None)
+                continue
+            
+            if is_score_row:
+                cell = _styled_cell(ws, value, style=_SCORE_STYLES[buckets[col_idx - 2] + 1])
+            elif is_url_row:
+                # Make URLs clickable
+                cell = _styled_cell(ws, value, style="url_link")
+                cell.hyperlink = value
+            else:
+                cell = _styled_cell(ws, value, style="data_center")
+            row_cells.append(cell)
+            _track_width(col_widths, col_idx, value)
+        
+        rows.append(row_cells)
+    
+    return rows
 
 def create_excel_report(results: List[Dict[str, Any]], filepath: str, table_rows: List[Tuple[str, str]]) -> None:
     """
@@ -20,157 +204,112 @@ def create_excel_report(results: List[Dict[str, Any]], filepath: str, table_rows
         table_rows: List of (key, display_name) tuples defining the structure
     """
     
-    # Create workbook and worksheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "RateMySite Analysis"
-    
-    # Define styles
-    header_font = Font(bold=True, color="FFFFFF", size=12)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    # Create write-only workbook and worksheet (rows are streamed on save)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("RateMySite Analysis")
     
-    subheader_font = Font(bold=True, size=11)
-    subheader_fill = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
+    _register_styles(wb)
     
-    score_font = Font(bold=True)
-    
-    border = Border(
-        left=Side(border_style="thin"),
-        right=Side(border_style="thin"),
-        top=Side(border_style="thin"),
-        bottom=Side(border_style="thin")
-    )
-    
-    center_alignment = Alignment(horizontal="center", vertical="center")
-    left_alignment = Alignment(horizontal="left", vertical="center")
+    # Rows are collected first: write-only sheets need column widths set
+    # before the first row is appended. Widths are tracked as values are added.
+    rows = []
+    col_widths: Dict[int, int] = {}
     
     # Add title and metadata
-    ws['A1'] = "RateMySite Analysis Report"
-    ws['A1'].font = Font(bold=True, size=16)
-    ws['A2'] = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    ws['A3'] = f"Total sites analyzed: {len(results)}"
+    title = "RateMySite Analysis Report"
+    generated = f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    total = f"Total sites analyzed: {len(results)}"
+    rows.append([_styled_cell(ws, title, font=_TITLE_FONT)])
+    rows.append([generated])
+    rows.append([total])
+    for text in (title, generated, total):
+        _track_width(col_widths, 1, text)
     
     # Start data table at row 5
-    start_row = 5
-    current_row = start_row
+    rows.append([])
     
     if not results:
-        ws[f'A{current_row}'] = "No results to display"
+        rows.append(["No results to display"])
+        for row in rows:
+            ws.append(row)
         wb.save(filepath)
         return
     
+    domains, value_grid, bucket_grid, score_fields, scores = _prepare(results, table_rows)
+    
     # Create headers - Category column + one column per analyzed site
-    ws[f'A{current_row}'] = "Category"
-    ws[f'A{current_row}'].font = header_font
-    ws[f'A{current_row}'].fill = header_fill
-    ws[f'A{current_row}'].alignment = center_alignment
-    ws[f'A{current_row}'].border = border
+    header_row = [_styled_cell(ws, "Category", style="hdr")]
+    _track_width(col_widths, 1, "Category")
     
     # Add URL headers
-    for col_idx, result in enumerate(results, start=2):
-        col_letter = chr(ord('A') + col_idx - 1)  # B, C, D, etc.
-        url = result.get('URL', 'Unknown')
-        
-        # Try to extract domain name for cleaner headers
-        try:
-            if url.startswith(('http://', 'https://')):
-                domain = url.split('//')[1].split('/')[0]
-                # Remove www. if present
-                domain = domain.replace('www.', '')
-            else:
-                domain = url
-        except:
-            domain = url
-            
-        ws[f'{col_letter}{current_row}'] = domain
-        ws[f'{col_letter}{current_row}'].font = header_font
-        ws[f'{col_letter}{current_row}'].fill = header_fill
-        ws[f'{col_letter}{current_row}'].alignment = center_alignment
-        ws[f'{col_letter}{current_row}'].border = border
+    for col_idx, domain in enumerate(domains, start=2):
+        header_row.append(_styled_cell(ws, domain, style="hdr"))
+        _track_width(col_widths, col_idx, domain)
     
-    current_row += 1
+    rows.append(header_row)
     
     # Add data rows based on table_rows structure
-    for row_key, row_display in table_rows:
-        # Category name in column A
-        ws[f'A{current_row}'] = row_display
-        ws[f'A{current_row}'].font = subheader_font
-        ws[f'A{current_row}'].fill = subheader_fill
-        ws[f'A{current_row}'].alignment = left_alignment
-        ws[f'A{current_row}'].border = border
-        
-        # Data for each site
-        for col_idx, result in enumerate(results, start=2):
-            col_letter = chr(ord('A') + col_idx - 1)
-            
-            value = result.get(row_key, '-')
-            if value is None:
-                value = '-'
-            
-            cell = ws[f'{col_letter}{current_row}']
-            cell.value = str(value)
-            cell.border = border
-            cell.alignment = center_alignment
-            
-            # Special formatting for scores
-            if 'Score' in row_key and value != '-' and str(value).isdigit():
-                cell.font = score_font
-                score = int(value)
-                if score >= 80:
-                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Light green
-                elif score >= 60:
-                    cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Light yellow
-                elif score < 60:
-                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Light red
-            
-            # Special formatting for URLs (make them clickable)
-            elif row_key == 'URL' and value != '-':
-                cell.hyperlink = value
-                cell.font = Font(color="0000FF", underline="single")
-        
-        current_row += 1
+    rows.extend(_build_data_rows(ws, table_rows, value_grid, bucket_grid, col_widths))
     
     # Add summary section
-    current_row += 2
-    ws[f'A{current_row}'] = "Summary Statistics"
-    ws[f'A{current_row}'].font = Font(bold=True, size=14)
-    current_row += 1
+    rows.append([])
+    rows.append([])
+    rows.append([_styled_cell(ws, "Summary Statistics", font=_SECTION_FONT)])
+    _track_width(col_widths, 1, "Summary Statistics")
     
-    # Calculate average scores
-    score_fields = [key for key, _ in table_rows if 'Score' in key]
+    # Calculate average scores from the (sites x score fields) array
+    counts = np.count_nonzero(~np.isnan(scores), axis=0)
+    totals = np.nansum(scores, axis=0)
     
-    for score_field in score_fields:
-        scores = []
-        for result in results:
-            value = result.get(score_field, '-')
-            if value != '-' and str(value).isdigit():
-                scores.append(int(value))
-        
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            ws[f'A{current_row}'] = f"Average {score_field}:"
-            ws[f'B{current_row}'] = f"{avg_score:.1f}"
-            current_row += 1
-    
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        
-        # Set minimum and maximum widths
-        adjusted_width = min(max(max_length + 2, 10), 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+    for score_field, count, total in zip(score_fields, counts, totals):
+        if count:
+            avg_score = total / count
+            label = f"Average {score_field}:"
+            avg_text = f"{avg_score:.1f}"
+            rows.append([label, avg_text])
+            _track_width(col_widths, 1, label)
+            _track_width(col_widths, 2, avg_text)
+    
+    # Apply the tracked column widths
+    for col_idx, width in col_widths.items():
+        ws.column_dimensions[get_column_letter(col_idx)].width = width
     
-    # Save the workbook
+    # Stream rows into the sheet and save the workbook
+    for row in rows:
+        ws.append(row)
     wb.save(filepath)
 
+def _result_keys(results: List[Dict[str, Any]]) -> List[str]:
+    """Union of keys across results in first-seen order, excluding the raw data column"""
+    return list(dict.fromkeys(key for result in results for key in result if key != '_raw'))
+
+def _header_cells(ws, columns: List[str]) -> List[Cell]:
+    """Build a bold, bordered header row for a detailed report sheet"""
+    return [_styled_cell(ws, column, font=_BOLD_FONT, border=_THIN_BORDER, alignment=_DETAIL_HEADER_ALIGNMENT)
+            for column in columns]
+
+def _build_summary_rows(results: List[Dict[str, Any]]) -> Tuple[List[str], Iterator[tuple]]:
+    """Header and lazily built rows for the Summary sheet"""
+    columns = ['URL', 'Company', 'Overall Score', 'Consumer Score', 'Developer Score',
+               'Investor Score', 'Trust Score', 'UX Score']
+    rows = (tuple(result.get(col, '') for col in columns) for result in results)
+    return columns, rows
+
+def _build_detailed_rows(results: List[Dict[str, Any]]) -> Tuple[List[str], Iterator[tuple]]:
+    """Header and lazily built rows for the Detailed Data sheet (raw data column is too verbose for Excel)"""
+    keys = _result_keys(results)
+    rows = (tuple(result.get(key) for key in keys) for result in results)
+    return keys, rows
+
+def _build_scores_rows(results: List[Dict[str, Any]]) -> Tuple[List[str], Iterator[tuple]]:
+    """Header and lazily built rows for the Scores Comparison sheet (only numeric scores)"""
+    score_columns = ['Overall Score', 'Consumer Score', 'Developer Score', 
+                    'Investor Score', 'Clarity Score', 'Visual Design Score', 
+                    'UX Score', 'Trust Score', 'Value Prop Score']
+    rows = ((result.get('URL', ''),) + tuple(_to_int(result.get(col)) for col in score_columns)
+            for result in results)
+    return ['URL'] + score_columns, rows
+
 def create_detailed_excel_report(results: List[Dict[str, Any]], filepath: str) -> None:
     """
     Create a detailed Excel report with multiple sheets
@@ -180,52 +319,58 @@ def create_detailed_excel_report(results: List[Dict[str, Any]], filepath: str) -
         filepath: Path where Excel file should be saved
     """
     
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        
-        # Summary sheet
-        summary_data = []
-        for result in results:
-            row = {
-                'URL': result.get('URL', ''),
-                'Company': result.get('Company', ''),
-                'Overall Score': result.get('Overall Score', ''),
-                'Consumer Score': result.get('Consumer Score', ''),
-                'Developer Score': result.get('Developer Score', ''),
-                'Investor Score': result.get('Investor Score', ''),
-                'Trust Score': result.get('Trust Score', ''),
-                'UX Score': result.get('UX Score', ''),
-            }
-            summary_data.append(row)
-        
-        if summary_data:
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Detailed data sheet
-        if results:
-            detailed_df = pd.DataFrame(results)
-            # Remove raw data column if it exists (too verbose for Excel)
-            if '_raw' in detailed_df.columns:
-                detailed_df = detailed_df.drop('_raw', axis=1)
-            detailed_df.to_excel(writer, sheet_name='Detailed Data', index=False)
-        
-        # Scores comparison sheet (only numeric scores)
-        scores_data = []
-        score_columns = ['Overall Score', 'Consumer Score', 'Developer Score', 
-                        'Investor Score', 'Clarity Score', 'Visual Design Score', 
-                        'UX Score', 'Trust Score', 'Value Prop Score']
-        
-        for result in results:
-            row = {'URL': result.get('URL', '')}
-            for col in score_columns:
-                value = result.get(col, '')
-                # Convert to numeric if possible
-                try:
-                    row[col] = int(value) if value and str(value).isdigit() else None
-                except:
-                    row[col] = None
-            scores_data.append(row)
-        
-        if scores_data:
-            scores_df = pd.DataFrame(scores_data)
-            scores_df.to_excel(writer, sheet_name='Scores Comparison', index=False)
+    wb = Workbook(write_only=True)
+    
+    if not results:
+        ws = wb.create_sheet('Summary')
+        ws.append(["No results to display"])
+        wb.save(filepath)
+        return
+    
+    sheets = (
+        ('Summary', _build_summary_rows),
+        ('Detailed Data', _build_detailed_rows),
+        ('Scores Comparison', _build_scores_rows),
+    )
+    
+    # Rows are generated one at a time as they are appended, so memory stays
+    # flat however many results there are
+    for sheet_name, build_rows in sheets:
+        columns, rows = build_rows(results)
+        ws = wb.create_sheet(sheet_name)
+        ws.append(_header_cells(ws, columns))
+        for row in rows:
+            ws.append(row)
+    
+    wb.save(filepath)
+
+def create_arrow_report(results: List[Dict[str, Any]], filepath: str) -> None:
+    """
+    Write analysis results as a columnar Arrow table for programmatic use
+    
+    Score columns are stored as nullable integers, everything else as strings.
+    Files ending in .feather or .arrow are written as Feather, anything else
+    as Parquet.
+    
+    Args:
+        results: List of dictionaries containing analysis data
+        filepath: Path where the file should be saved
+    """
+    import pyarrow as pa
+    
+    keys = _result_keys(results)
+    fields = [pa.field(key, pa.int64() if 'Score' in key else pa.string()) for key in keys]
+    columns = {}
+    for key in keys:
+        if 'Score' in key:
+            columns[key] = [_to_int(result.get(key)) for result in results]
+        else:
+            columns[key] = [None if result.get(key) is None else str(result.get(key)) for result in results]
+    table = pa.table(columns, schema=pa.schema(fields))
+    
+    if filepath.endswith(('.feather', '.arrow')):
+        import pyarrow.feather as feather
+        feather.write_feather(table, filepath)
+    else:
+        import pyarrow.parquet as pq
+        pq.write_table(table, filepath)